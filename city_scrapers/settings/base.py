@@ -24,6 +24,12 @@ AUTOTHROTTLE_TARGET_CONCURRENCY = float(
     os.getenv("AUTOTHROTTLE_TARGET_CONCURRENCY", 1.0)
 )
 
+# Optionally cache responses on disk and revalidate them with conditional
+# requests (If-None-Match/If-Modified-Since) on later runs
+HTTPCACHE_ENABLED = os.getenv("HTTPCACHE_ENABLED", "").lower() in ("1", "true")
+HTTPCACHE_POLICY = "scrapy.extensions.httpcache.RFC2616Policy"
+HTTPCACHE_STORAGE = "scrapy.extensions.httpcache.FilesystemCacheStorage"
+
 # Configure item pipelines
 ITEM_PIPELINES = {
     "city_scrapers_core.pipelines.MeetingPipeline": 200,
@@ -1,6 +1,6 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
 
-import pytz
 from city_scrapers_core.constants import CITY_COUNCIL, COMMITTEE, NOT_CLASSIFIED
 from city_scrapers_core.items import Meeting
 from city_scrapers_core.spiders import CityScrapersSpider
@@ -24,17 +24,17 @@ class SandieCityCouncilSpider(CityScrapersSpider):
         adjusted to 1am on the first of the month in Los Angeles time.
         """
         # Local timezone
-        tz = pytz.timezone(self.timezone)
+        tz = ZoneInfo(self.timezone)
 
         # Get start of current month at 1 AM
         now = datetime.now(tz)
-        start_of_current_month = datetime(now.year, now.month, 1, 1, 0)
-        start_of_current_month = tz.localize(start_of_current_month)
+        start_of_current_month = datetime(now.year, now.month, 1, 1, 0, tzinfo=tz)
 
         # Get start of next month at 1 AM
         next_month = start_of_current_month + timedelta(days=31)
-        start_of_next_month = datetime(next_month.year, next_month.month, 1, 1, 0)
-        start_of_next_month = tz.localize(start_of_next_month)
+        start_of_next_month = datetime(
+            next_month.year, next_month.month, 1, 1, 0, tzinfo=tz
+        )
 
         # Generate timestamps for URLs
         current_month_ts = int(start_of_current_month.timestamp())
@@ -51,16 +51,17 @@ class SandieCityCouncilSpider(CityScrapersSpider):
         """
         Parse the calendar page and extract the events if there are any for a given day.
         """
+        source = self._parse_source(response)
         calendar = response.css(".calendar-view-table.calendar-view-month")
         for day in calendar.css("tbody tr td.current-month"):
-            # get date
-            date_obj = self._parse_date(day)
-
             # skip if no events
             events = day.css("ul li")
             if len(events) == 0:
                 continue
 
+            # get date
+            date_obj = self._parse_date(day)
+
             # loop through events
             for event in events:
                 title = event.css("a::text").get()
@@ -75,8 +76,8 @@ class SandieCityCouncilSpider(CityScrapersSpider):
                     all_day=False,
                     time_notes="",
                     location=self.location,
-                    links=self._parse_links(event),
-                    source=self._parse_source(response),
+                    links=self._parse_links(event, response),
+                    source=source,
                 )
                 meeting["status"] = self._get_status(meeting)
                 meeting["id"] = self._get_id(meeting)
@@ -85,9 +86,7 @@ class SandieCityCouncilSpider(CityScrapersSpider):
     def _parse_date(self, day):
         """Parse the calendar date from the day element."""
         date_str = day.css(".calendar-view-day__number::attr('datetime')").get()
-        date_part = date_str[:10]
-        date_obj = datetime.strptime(date_part, "%Y-%m-%d").date()
-        return date_obj
+        return date.fromisoformat(date_str[:10])
 
     def _parse_classification(self, title):
         """Parse classification from title."""
@@ -101,15 +100,20 @@ class SandieCityCouncilSpider(CityScrapersSpider):
     def _parse_start(self, date_obj, event):
         """Parse start datetime as a naive datetime object."""
         time_str = event.css("span.fine-print::text").get()
-        time_obj = datetime.strptime(time_str, "%I:%M %p").time()
-        return datetime.combine(date_obj, time_obj)
+        # Times are always formatted like "2:00 pm"
+        hour_str, rest = time_str.strip().split(":", 1)
+        minute_str, meridiem = rest.split(None, 1)
+        hour = int(hour_str) % 12
+        if meridiem.lower() == "pm":
+            hour += 12
+        return datetime.combine(date_obj, time(hour, int(minute_str)))
 
     def _parse_location(self, item):
         """Parse or generate location."""
         return
 
-    def _parse_links(self, event):
-        """Parse links."""
+    def _parse_links(self, event, response):
+        """Parse links, resolving relative agenda links against the page URL."""
         links = [
             {
                 "href": "https://sandiego.granicus.com/ViewPublisher.php?view_id=31",
@@ -118,7 +122,9 @@ class SandieCityCouncilSpider(CityScrapersSpider):
         ]
         agenda_link = event.css("a::attr('href')").get()
         if agenda_link:
-            links.append({"href": agenda_link, "title": "Meeting materials"})
+            links.append(
+                {"href": response.urljoin(agenda_link), "title": "Meeting materials"}
+            )
         return links
 
     def _parse_source(self, response):
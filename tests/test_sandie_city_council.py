@@ -1,7 +1,7 @@
 from datetime import datetime
 from os.path import dirname, join
 
-import pytest  # noqa
+import pytest
 from city_scrapers_core.constants import CITY_COUNCIL, TENTATIVE
 from city_scrapers_core.utils import file_response
 from freezegun import freeze_time
@@ -14,61 +14,64 @@ test_response = file_response(
 )
 spider = SandieCityCouncilSpider()
 
-freezer = freeze_time("2024-01-30")
-freezer.start()
 
-parsed_items = [item for item in spider.parse(test_response)]
+@pytest.fixture(scope="module")
+def parsed_items():
+    with freeze_time("2024-01-30"):
+        return list(spider.parse(test_response))
 
-freezer.stop()
 
-
-def test_count():
+def test_count(parsed_items):
     assert len(parsed_items) == 25
 
 
-def test_title():
+def test_title(parsed_items):
     assert parsed_items[20]["title"] == "City Council"
 
 
-def test_description():
+def test_description(parsed_items):
     assert parsed_items[20]["description"] == ""
 
 
-def test_start():
+def test_start(parsed_items):
     assert parsed_items[20]["start"] == datetime(2024, 2, 26, 10, 0)
 
 
-def test_end():
+def test_start_pm(parsed_items):
+    assert parsed_items[0]["start"] == datetime(2024, 2, 1, 13, 0)
+
+
+def test_end(parsed_items):
     assert parsed_items[20]["end"] is None
 
 
-def test_time_notes():
+def test_time_notes(parsed_items):
     assert parsed_items[20]["time_notes"] == ""
 
 
-def test_id():
+def test_id(parsed_items):
     assert parsed_items[20]["id"] == "sandie_city_council/202402261000/x/city_council"
 
 
-def test_status():
+def test_status(parsed_items):
     assert parsed_items[20]["status"] == TENTATIVE
 
 
-def test_location():
+def test_location(parsed_items):
     assert parsed_items[20]["location"] == {
         "name": "San Diego City Administration Center",
         "address": "202 C Street, San Diego",
     }
 
 
-def test_source():
+def test_source(parsed_items):
     assert (
         parsed_items[20]["source"]
         == "https://www.sandiego.gov/city-clerk/officialdocs/meetings-calendar?calendar_timestamp=1706778000"  # noqa: E501
     )
 
 
-def test_links():
+def test_links(parsed_items):
     assert parsed_items[20]["links"] == [
         {
             "href": "https://sandiego.granicus.com/ViewPublisher.php?view_id=31",
@@ -81,9 +84,24 @@ def test_links():
     ]
 
 
-def test_classification():
+def test_classification(parsed_items):
     assert parsed_items[20]["classification"] == CITY_COUNCIL
 
 
-def test_all_day():
+def test_all_day(parsed_items):
     assert parsed_items[20]["all_day"] is False
+
+
+@freeze_time("2024-01-30")
+def test_start_requests():
+    assert [request.url for request in spider.start_requests()] == [
+        "https://www.sandiego.gov/city-clerk/officialdocs/meetings-calendar?calendar_timestamp=1704099600",  # noqa: E501
+        "https://www.sandiego.gov/city-clerk/officialdocs/meetings-calendar?calendar_timestamp=1706778000",  # noqa: E501
+    ]
+
+
+def test_links_relative(parsed_items):
+    assert parsed_items[2]["links"][1] == {
+        "href": "https://www.sandiego.gov/event/closed-session-adjourned-4",
+        "title": "Meeting materials",
+    }